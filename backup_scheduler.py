@@ -5,13 +5,79 @@ import hashlib
 import hmac
 import secrets
 import base64
+import binascii
 import json
 import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf import pbkdf2
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+_HASH_NAMES = ('md5', 'sha1', 'sha256', 'sha512', 'blake2b')
+_HASH_PROTOTYPES = tuple(hashlib.new(name) for name in _HASH_NAMES)
+_DH_PRIME = 0xFFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74020BBEA63B139B22514A08798E3404DDEF9519B3CD3A431B302B0A6DF25F14374FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7EDEE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF0598DA48361C55D39A69163FA8FD24CF5F83655D23DCA3AD961C62F356208552BB9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3BE39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF6955817183995497CEA956AE515D2261898FA051015728E5A8AACAA68FFFFFFFFFFFFFFFF
+_DH_GENERATOR = 2
+_DH_PRIME_MPZ = gmpy2.mpz(_DH_PRIME) if gmpy2 is not None else None
+_DH_PRIME_PREFIX = hex(_DH_PRIME)[:50] + '...'
+_ENCODED_JWT_HEADER = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b'=').decode()
+_DIGEST_POOL = ThreadPoolExecutor(max_workers=len(_HASH_NAMES))
+_PARALLEL_DIGEST_BYTES = 64 * 1024
+_LEAF_CACHE_MAX_LEAVES = 1024
+
+def _hexdigest(prototype, view):
+    hasher = prototype.copy()
+    hasher.update(view)
+    return hasher.hexdigest()
+
+@functools.lru_cache(maxsize=128)
+def _pbkdf2(password_bytes, salt, iterations):
+    kdf = pbkdf2.PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=iterations,
+        backend=default_backend()
+    )
+    return kdf.derive(password_bytes)
+
+def _hex_prefix(value, digits=48):
+    excess = (value.bit_length() + 3) // 4 - digits
+    if excess > 0:
+        value >>= 4 * excess
+    return hex(value)
+
+def _b64encode(raw):
+    return binascii.b2a_base64(raw, newline=False).decode()
+
+def _b64url_encode(raw):
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+def _leaf_digests(leaves):
+    sha256 = hashlib.sha256
+    return b''.join([sha256(str(i).encode()).digest() for i in range(leaves)])
+
+_cached_leaf_digests = functools.lru_cache(maxsize=64)(_leaf_digests)
+
+def _hash_level(level):
+    if len(level) % 64:
+        level += level[-32:]
+    next_level = bytearray(len(level) // 2)
+    for i in range(0, len(level), 64):
+        next_level[i // 2:i // 2 + 32] = hashlib.sha256(level[i:i + 64]).digest()
+    return bytes(next_level)
+
+def _merkle_root(level):
+    while len(level) > 32:
+        level = _hash_level(level)
+    return level
+
 class CryptoUtils:
     def __init__(self):
         self.backend = default_backend()
@@ -28,26 +94,18 @@ class CryptoUtils:
         if salt is None:
             salt = secrets.token_bytes(16)
         
-        kdf = pbkdf2.PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=iterations,
-            backend=self.backend
-        )
-        key = kdf.derive(password.encode() if isinstance(password, str) else password)
+        password_bytes = password.encode() if isinstance(password, str) else bytes(password)
+        key = _pbkdf2(password_bytes, bytes(salt), iterations)
         return key, salt
     
     def hash_file_simulate(self, data):
-        results = {}
+        view = memoryview(data).toreadonly()
+        if view.nbytes < _PARALLEL_DIGEST_BYTES:
+            return {name: _hexdigest(prototype, view) for name, prototype in zip(_HASH_NAMES, _HASH_PROTOTYPES)}
         
-        results['md5'] = hashlib.md5(data).hexdigest()
-        results['sha1'] = hashlib.sha1(data).hexdigest()
-        results['sha256'] = hashlib.sha256(data).hexdigest()
-        results['sha512'] = hashlib.sha512(data).hexdigest()
-        results['blake2b'] = hashlib.blake2b(data).hexdigest()
+        futures = [_DIGEST_POOL.submit(_hexdigest, prototype, view) for prototype in _HASH_PROTOTYPES]
         
-        return results
+        return {name: future.result() for name, future in zip(_HASH_NAMES, futures)}
     
     def hmac_signature(self, key, message):
         return hmac.new(key, message, hashlib.sha256).hexdigest()
@@ -64,16 +122,15 @@ class CryptoUtils:
         ciphertext = encryptor.update(padded_data) + encryptor.finalize()
         
         return {
-            'ciphertext': base64.b64encode(ciphertext).decode(),
-            'iv': base64.b64encode(iv).decode(),
-            'key': base64.b64encode(key).decode(),
+            'ciphertext': _b64encode(ciphertext),
+            'iv': _b64encode(iv),
+            'key': _b64encode(key),
             'algorithm': 'AES-256-CBC'
         }
     
     def _pad_data(self, data, block_size=16):
         padding_length = block_size - (len(data) % block_size)
-        padding = bytes([padding_length] * padding_length)
-        return data + padding
+        return data + bytes((padding_length,)) * padding_length
     
     def generate_rsa_keypair_mock(self):
         return {
@@ -92,48 +149,48 @@ class CryptoUtils:
                 'scope': 'read:repo write:repo'
             }
         
-        header = {'alg': 'HS256', 'typ': 'JWT'}
-        encoded_header = base64.b64encode(json.dumps(header).encode()).decode().rstrip('=')
-        encoded_payload = base64.b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+        encoded_payload = _b64url_encode(json.dumps(payload, separators=(',', ':')).encode())
         
-        signature = secrets.token_hex(20)
+        signature = _b64url_encode(secrets.token_bytes(32))
         
-        return f"{encoded_header}.{encoded_payload}.{signature}"
+        return f"{_ENCODED_JWT_HEADER}.{encoded_payload}.{signature}"
     
     def diffie_hellman_mock(self):
-        prime = 0xFFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74020BBEA63B139B22514A08798E3404DDEF9519B3CD3A431B302B0A6DF25F14374FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7EDEE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF0598DA48361C55D39A69163FA8FD24CF5F83655D23DCA3AD961C62F356208552BB9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3BE39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF6955817183995497CEA956AE515D2261898FA051015728E5A8AACAA68FFFFFFFFFFFFFFFF
-        generator = 2
+        prime = _DH_PRIME
+        generator = _DH_GENERATOR
         
         private = secrets.randbits(256)
-        public = pow(generator, private, prime)
+        if gmpy2 is not None:
+            public = int(gmpy2.powmod(generator, private, _DH_PRIME_MPZ))
+        else:
+            public = pow(generator, private, prime)
         
         return {
-            'prime': hex(prime)[:50] + '...',
+            'prime': _DH_PRIME_PREFIX,
             'generator': generator,
-            'public_key': hex(public)[:50] + '...'
+            'public_key': _hex_prefix(public) + '...'
         }
     
     def merkle_tree_mock(self, leaves=16):
-        tree = []
-        level = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(leaves)]
-        tree.append(level)
-        
-        while len(level) > 1:
-            next_level = []
-            for i in range(0, len(level), 2):
-                if i + 1 < len(level):
-                    combined = level[i] + level[i + 1]
-                else:
-                    combined = level[i] + level[i]
-                next_level.append(hashlib.sha256(combined.encode()).hexdigest())
-            tree.append(next_level)
-            level = next_level
+        if leaves <= _LEAF_CACHE_MAX_LEAVES:
+            level = _cached_leaf_digests(leaves)
+        else:
+            level = _leaf_digests(leaves)
+        
+        root = _merkle_root(level)
+        
+        depth = 1
+        nodes = width = leaves
+        while width > 1:
+            width = (width + 1) // 2
+            depth += 1
+            nodes += width
         
         return {
             'leaves': leaves,
-            'root': tree[-1][0],
-            'depth': len(tree),
-            'nodes': sum(len(l) for l in tree)
+            'root': root.hex(),
+            'depth': depth,
+            'nodes': nodes
         }
     
     def run(self):
@@ -2,14 +2,17 @@
 import time
 import random
 import threading
-import queue
 from datetime import datetime, timedelta
 from collections import deque
 import heapq
+import itertools
 
 class TaskScheduler:
     def __init__(self):
-        self.task_queue = queue.PriorityQueue()
+        self._heap = []
+        self._ready = []
+        self._sequence = itertools.count()
+        self._cv = threading.Condition()
         self.completed_tasks = deque(maxlen=1000)
         self.failed_tasks = deque(maxlen=500)
         self.running_tasks = {}
@@ -53,10 +56,29 @@ class TaskScheduler:
         scheduled_time = time.time() + delay
         
         task = self.Task(task_id, name, priority, scheduled_time)
-        self.task_queue.put((priority, task))
+        self._push(task)
         
         return task_id
     
+    def _push(self, task):
+        with self._cv:
+            heapq.heappush(self._heap, (task.scheduled_time, task.priority, next(self._sequence), task))
+            self._cv.notify()
+    
+    def _next_task(self):
+        with self._cv:
+            while self.running:
+                now = time.time()
+                while self._heap and self._heap[0][0] <= now:
+                    _, priority, sequence, task = heapq.heappop(self._heap)
+                    heapq.heappush(self._ready, (priority, sequence, task))
+                
+                if self._ready:
+                    return heapq.heappop(self._ready)[-1]
+                
+                self._cv.wait(timeout=self._heap[0][0] - now if self._heap else 1)
+        return None
+    
     def generate_random_tasks(self, count=50):
         task_names = [
             'backup_database', 'cleanup_temp', 'sync_repositories',
@@ -74,51 +96,42 @@ class TaskScheduler:
     
     def worker_function(self, worker_id):
         while self.running:
+            task = self._next_task()
+            if task is None:
+                continue
+            
+            task.status = 'running'
+            task.started_at = time.time()
+            task.worker_id = worker_id
+            
+            self.running_tasks[task.task_id] = task
+            
             try:
-                priority, task = self.task_queue.get(timeout=1)
-                
-                if task.scheduled_time > time.time():
-                    self.task_queue.put((priority, task))
-                    time.sleep(0.1)
-                    continue
-                
-                task.status = 'running'
-                task.started_at = time.time()
-                task.worker_id = worker_id
-                
-                self.running_tasks[task.task_id] = task
+                result = self.execute_task(task)
+                task.status = 'completed'
+                task.completed_at = time.time()
+                task.result = result
                 
-                try:
-                    result = self.execute_task(task)
-                    task.status = 'completed'
-                    task.completed_at = time.time()
-                    task.result = result
-                    
-                    self.completed_tasks.append({
-                        'task': task.to_dict(),
-                        'result': result,
-                        'worker': worker_id
-                    })
-                    
-                except Exception as e:
-                    task.status = 'failed'
-                    task.error = str(e)
-                    task.retries += 1
-                    
-                    if task.retries < task.max_retries:
-                        task.priority = max(1, task.priority - 1)
-                        self.task_queue.put((priority, task))
-                    else:
-                        self.failed_tasks.append(task.to_dict())
+                self.completed_tasks.append({
+                    'task': task.to_dict(),
+                    'result': result,
+                    'worker': worker_id
+                })
                 
-                finally:
-                    if task.task_id in self.running_tasks:
-                        del self.running_tasks[task.task_id]
+            except Exception as e:
+                task.status = 'failed'
+                task.error = str(e)
+                task.retries += 1
                 
-                self.task_queue.task_done()
-                
-            except queue.Empty:
-                continue
+                if task.retries < task.max_retries:
+                    task.priority = max(1, task.priority - 1)
+                    self._push(task)
+                else:
+                    self.failed_tasks.append(task.to_dict())
+            
+            finally:
+                if task.task_id in self.running_tasks:
+                    del self.running_tasks[task.task_id]
     
     def execute_task(self, task):
         task_type = task.name
@@ -176,12 +189,14 @@ class TaskScheduler:
     
     def stop_workers(self):
         self.running = False
+        with self._cv:
+            self._cv.notify_all()
         for w in self.workers:
             w.join(timeout=2)
     
     def get_stats(self):
         return {
-            'queue_size': self.task_queue.qsize(),
+            'queue_size': len(self._heap) + len(self._ready),
             'completed_count': len(self.completed_tasks),
             'failed_count': len(self.failed_tasks),
             'running_count': len(self.running_tasks),
@@ -1,37 +1,45 @@
-import socket
-import urllib.request
-import urllib.error
-import json
-import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def _make_adapter(retries):
+    return HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=retries - 1,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            respect_retry_after_header=False
+        )
+    )
 
 class NetworkClient:
     def __init__(self):
         self.timeout = 10
-        self.retries = 3
         self.agent = 'PyDist/6.2.8'
+        self.session = requests.Session()
+        self.retries = 3
+    
+    @property
+    def retries(self):
+        return self._retries
+    
+    @retries.setter
+    def retries(self, value):
+        self._retries = value
+        adapter = _make_adapter(value)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def fetch_json(self, url):
-        req = urllib.request.Request(url, headers={'User-Agent': self.agent})
-        for attempt in range(self.retries):
-            try:
-                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
-                    return json.loads(resp.read().decode('utf-8'))
-            except:
-                if attempt == self.retries - 1:
-                    raise
-                time.sleep(0.5 * (attempt + 1))
-        return None
+        resp = self.session.get(url, headers={'User-Agent': self.agent}, timeout=self.timeout)
+        resp.raise_for_status()
+        return resp.json()
     
     def fetch_text(self, url):
-        req = urllib.request.Request(url, headers={'User-Agent': self.agent})
-        for attempt in range(self.retries):
-            try:
-                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
-                    return resp.read().decode('utf-8').strip()
-            except:
-                if attempt == self.retries - 1:
-                    raise
-                time.sleep(0.5 * (attempt + 1))
-        return None
+        resp = self.session.get(url, headers={'User-Agent': self.agent}, timeout=self.timeout)
+        resp.raise_for_status()
+        return resp.content.decode('utf-8').strip()
 
 client = NetworkClient()
\ No newline at end of file
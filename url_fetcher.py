@@ -3,8 +3,68 @@ import time
 import random
 import threading
 import heapq
+import bisect
+import itertools
 from collections import deque, defaultdict
+from collections.abc import MutableMapping
 from datetime import datetime
+import numpy as np
+import xxhash
+
+_RNG = np.random.default_rng()
+_RAND_BATCH = 4096
+
+def _jump_consistent_hash(key, buckets):
+    bucket, jump = -1, 0
+    while jump < buckets:
+        bucket = jump
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        jump = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+class _ServerView(MutableMapping):
+    _COLUMNS = {
+        'weight': 'weights',
+        'connections': 'connections',
+        'requests': 'requests',
+        'errors': 'errors',
+        'healthy': 'healthy'
+    }
+    
+    def __init__(self, balancer, fields):
+        self._balancer = balancer
+        self._fields = fields
+    
+    def __getitem__(self, key):
+        column = self._COLUMNS.get(key)
+        if column is None:
+            return self._fields[key]
+        return getattr(self._balancer, column)[self._fields['index']].item()
+    
+    def __setitem__(self, key, value):
+        column = self._COLUMNS.get(key)
+        if column is None:
+            self._fields[key] = value
+            return
+        getattr(self._balancer, column)[self._fields['index']] = value
+        if key in ('weight', 'healthy'):
+            with self._balancer.lock:
+                self._balancer._refresh_healthy()
+    
+    def __delitem__(self, key):
+        if key in self._COLUMNS:
+            raise KeyError(f"cannot delete column field {key!r}")
+        del self._fields[key]
+    
+    def __iter__(self):
+        yield from self._fields
+        yield from self._COLUMNS
+    
+    def __len__(self):
+        return len(self._fields) + len(self._COLUMNS)
+    
+    def __repr__(self):
+        return repr(dict(self))
 
 class LoadBalancer:
     def __init__(self):
@@ -16,25 +76,62 @@ class LoadBalancer:
         self.current_index = 0
         self.lock = threading.Lock()
         self.request_log = deque(maxlen=10000)
+        self.connections = np.zeros(0, dtype=np.int64)
+        self.weights = np.zeros(0, dtype=np.int64)
+        self.healthy = np.zeros(0, dtype=bool)
+        self.requests = np.zeros(0, dtype=np.int64)
+        self.errors = np.zeros(0, dtype=np.int64)
+        self._snapshot = ([], [])
+        self._total_requests = 0
+        self._latency_buf = []
+        self._latency_pos = 0
+        self._octet_buf = []
+        self._octet_pos = 0
+        self._set_dispatch()
         
     def add_server(self, host, port, weight=1):
         server_id = f"{host}:{port}"
-        server = {
+        fields = {
             'id': server_id,
+            'index': len(self.servers),
             'host': host,
             'port': port,
-            'weight': weight,
-            'connections': 0,
-            'requests': 0,
-            'errors': 0,
-            'latency': [],
-            'healthy': True,
+            'latency': deque(maxlen=100),
+            'latency_sum': 0.0,
             'last_check': time.time(),
             'added_at': time.time()
         }
-        self.servers.append(server)
+        with self.lock:
+            self.servers.append(_ServerView(self, fields))
+            self.connections = np.append(self.connections, 0)
+            self.weights = np.append(self.weights, weight)
+            self.healthy = np.append(self.healthy, True)
+            self.requests = np.append(self.requests, 0)
+            self.errors = np.append(self.errors, 0)
+            self._refresh_healthy()
         return server_id
     
+    def _refresh_healthy(self):
+        healthy_servers = np.flatnonzero(self.healthy).tolist()
+        weights = self.weights.tolist()
+        self._snapshot = (healthy_servers, list(itertools.accumulate(weights[i] for i in healthy_servers)))
+    
+    def _next_latency(self):
+        if self._latency_pos >= len(self._latency_buf):
+            self._latency_buf = _RNG.uniform(5, 100, size=_RAND_BATCH).tolist()
+            self._latency_pos = 0
+        latency = self._latency_buf[self._latency_pos]
+        self._latency_pos += 1
+        return latency
+    
+    def _next_octets(self):
+        if self._octet_pos >= len(self._octet_buf):
+            self._octet_buf = _RNG.integers([1, 0, 0, 1], 255, size=(_RAND_BATCH, 4)).tolist()
+            self._octet_pos = 0
+        octets = self._octet_buf[self._octet_pos]
+        self._octet_pos += 1
+        return octets
+    
     def generate_server_pool(self, count=5):
         hosts = ['web1', 'web2', 'web3', 'app1', 'app2', 'api1', 'api2', 'cache1', 'db1']
         domains = ['internal', 'cluster.local', 'service.consul', 'backend.svc']
@@ -45,101 +142,124 @@ class LoadBalancer:
             weight = random.randint(1, 5)
             self.add_server(host, port, weight)
     
+    def _server_at(self, idx):
+        return None if idx is None else self.servers[idx]
+    
+    def _round_robin_index(self, client_ip=None):
+        healthy_servers, _ = self._snapshot
+        if not healthy_servers:
+            return None
+        
+        index = (self.current_index + 1) % len(healthy_servers)
+        self.current_index = index
+        return healthy_servers[index]
+    
+    def _least_connections_index(self, client_ip=None):
+        healthy_servers, _ = self._snapshot
+        if not healthy_servers:
+            return None
+        
+        connections = self.connections.tolist()
+        return min(healthy_servers, key=connections.__getitem__)
+    
+    def _random_index(self, client_ip=None):
+        healthy_servers, _ = self._snapshot
+        if not healthy_servers:
+            return None
+        
+        return random.choice(healthy_servers)
+    
+    def _weighted_index(self, client_ip=None):
+        healthy_servers, cum_weights = self._snapshot
+        if not healthy_servers:
+            return None
+        
+        r = random.uniform(0, cum_weights[-1])
+        return healthy_servers[min(bisect.bisect_left(cum_weights, r), len(healthy_servers) - 1)]
+    
+    def _ip_hash_index(self, client_ip):
+        healthy_servers, _ = self._snapshot
+        if not healthy_servers:
+            return None
+        
+        healthy = self.healthy
+        key = client_ip.encode()
+        for seed in range(healthy.size):
+            hash_val = _jump_consistent_hash(xxhash.xxh64_intdigest(key, seed), healthy.size)
+            if healthy[hash_val]:
+                return hash_val
+        
+        return healthy_servers[hash_val % len(healthy_servers)]
+    
+    def _ip_hash_or_round_robin_index(self, client_ip=None):
+        if client_ip:
+            return self._ip_hash_index(client_ip)
+        return self._round_robin_index()
+    
     def round_robin(self):
-        with self.lock:
-            healthy_servers = [s for s in self.servers if s['healthy']]
-            if not healthy_servers:
-                return None
-            
-            self.current_index = (self.current_index + 1) % len(healthy_servers)
-            return healthy_servers[self.current_index]
+        return self._server_at(self._round_robin_index())
     
     def least_connections(self):
-        with self.lock:
-            healthy_servers = [s for s in self.servers if s['healthy']]
-            if not healthy_servers:
-                return None
-            
-            return min(healthy_servers, key=lambda s: s['connections'])
+        return self._server_at(self._least_connections_index())
     
     def random_server(self):
-        with self.lock:
-            healthy_servers = [s for s in self.servers if s['healthy']]
-            if not healthy_servers:
-                return None
-            
-            return random.choice(healthy_servers)
+        return self._server_at(self._random_index())
     
     def weighted_random(self):
-        with self.lock:
-            healthy_servers = [s for s in self.servers if s['healthy']]
-            if not healthy_servers:
-                return None
-            
-            weights = [s['weight'] for s in healthy_servers]
-            total = sum(weights)
-            r = random.uniform(0, total)
-            
-            cumsum = 0
-            for server, weight in zip(healthy_servers, weights):
-                cumsum += weight
-                if r <= cumsum:
-                    return server
-            
-            return healthy_servers[0]
+        return self._server_at(self._weighted_index())
     
     def ip_hash(self, client_ip):
-        with self.lock:
-            healthy_servers = [s for s in self.servers if s['healthy']]
-            if not healthy_servers:
-                return None
-            
-            hash_val = hash(client_ip) % len(healthy_servers)
-            return healthy_servers[hash_val]
+        return self._server_at(self._ip_hash_index(client_ip))
+    
+    def _set_dispatch(self):
+        self._dispatch = {
+            'round_robin': self._round_robin_index,
+            'least_connections': self._least_connections_index,
+            'random': self._random_index,
+            'weighted': self._weighted_index,
+            'ip_hash': self._ip_hash_or_round_robin_index
+        }.get(self.algorithm, self._round_robin_index)
     
     def get_server(self, client_ip=None):
-        if self.algorithm == 'round_robin':
-            return self.round_robin()
-        elif self.algorithm == 'least_connections':
-            return self.least_connections()
-        elif self.algorithm == 'random':
-            return self.random_server()
-        elif self.algorithm == 'weighted':
-            return self.weighted_random()
-        elif self.algorithm == 'ip_hash' and client_ip:
-            return self.ip_hash(client_ip)
-        else:
-            return self.round_robin()
+        return self._server_at(self._dispatch(client_ip))
     
     def handle_request(self, client_ip=None):
-        server = self.get_server(client_ip)
+        idx = self._dispatch(client_ip)
         
-        if not server:
+        if idx is None:
             return {'error': 'no healthy servers'}
         
-        server['connections'] += 1
-        server['requests'] += 1
+        server = self.servers[idx]._fields
+        self.connections[idx] += 1
+        self.requests[idx] += 1
+        self._total_requests += 1
         
         start_time = time.time()
         
-        latency = random.uniform(5, 100)
+        latency = self._next_latency()
         time.sleep(latency / 1000)
         
         success = random.random() > 0.05
         status_code = 200 if success else random.choice([500, 502, 503, 504])
         
         if not success:
-            server['errors'] += 1
+            self.errors[idx] += 1
         
-        server['connections'] -= 1
-        server['latency'].append(latency)
+        self.connections[idx] -= 1
         
-        if len(server['latency']) > 100:
-            server['latency'] = server['latency'][-100:]
+        latencies = server['latency']
+        if len(latencies) == latencies.maxlen:
+            server['latency_sum'] -= latencies[0]
+        latencies.append(latency)
+        server['latency_sum'] += latency
+        
+        if not client_ip:
+            octets = self._next_octets()
+            client_ip = f"192.168.{octets[0]}.{octets[3]}"
         
         request_log = {
             'timestamp': time.time(),
-            'client': client_ip or f"192.168.{random.randint(1,254)}.{random.randint(1,254)}",
+            'client': client_ip,
             'server': server['id'],
             'latency': latency,
             'status': status_code,
@@ -151,29 +271,42 @@ class LoadBalancer:
         return request_log
     
     def health_check(self):
-        for server in self.servers:
+        changed = False
+        for idx, view in enumerate(self.servers):
+            server = view._fields
             if time.time() - server['last_check'] > 5:
-                server['healthy'] = random.random() > 0.1
+                healthy = random.random() > 0.1
+                if healthy != self.healthy[idx]:
+                    self.healthy[idx] = healthy
+                    changed = True
                 server['last_check'] = time.time()
+        
+        if changed:
+            with self.lock:
+                self._refresh_healthy()
     
     def get_server_stats(self, server_id):
-        for server in self.servers:
-            if server['id'] == server_id:
+        for view in self.servers:
+            if view['id'] == server_id:
+                server = view._fields
+                idx = server['index']
+                requests = int(self.requests[idx])
+                errors = int(self.errors[idx])
                 return {
                     'id': server['id'],
-                    'healthy': server['healthy'],
-                    'requests': server['requests'],
-                    'errors': server['errors'],
-                    'error_rate': server['errors'] / max(server['requests'], 1),
-                    'avg_latency': sum(server['latency']) / max(len(server['latency']), 1),
-                    'connections': server['connections']
+                    'healthy': bool(self.healthy[idx]),
+                    'requests': requests,
+                    'errors': errors,
+                    'error_rate': errors / max(requests, 1),
+                    'avg_latency': server['latency_sum'] / max(len(server['latency']), 1),
+                    'connections': int(self.connections[idx])
                 }
         return None
     
     def get_overall_stats(self):
-        total_requests = sum(s['requests'] for s in self.servers)
-        total_errors = sum(s['errors'] for s in self.servers)
-        healthy_count = sum(1 for s in self.servers if s['healthy'])
+        total_requests = self._total_requests
+        total_errors = int(self.errors.sum())
+        healthy_count = int(np.count_nonzero(self.healthy))
         
         return {
             'algorithm': self.algorithm,
@@ -191,7 +324,8 @@ class LoadBalancer:
         while time.time() < end_time:
             self.health_check()
             
-            client_ip = f"{random.randint(1,254)}.{random.randint(0,254)}.{random.randint(0,254)}.{random.randint(1,254)}"
+            a, b, c, d = self._next_octets()
+            client_ip = f"{a}.{b}.{c}.{d}"
             
             for _ in range(random.randint(1, 10)):
                 self.handle_request(client_ip)
@@ -200,6 +334,7 @@ class LoadBalancer:
     
     def change_algorithm(self):
         self.algorithm = random.choice([a for a in self.algorithms if a != self.algorithm])
+        self._set_dispatch()
 
 def main():
     lb = LoadBalancer()